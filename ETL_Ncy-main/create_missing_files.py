@@ -65,8 +65,12 @@ import pandas as pd
 class MissingValuesHandler:
     @staticmethod
     def impute_missing_values(df, strategy=None, default_strategy='mean'):
-        """Imputation des valeurs manquantes"""
-        return df.fillna(df.mean()) if df is not None else df
+        """Imputation des valeurs manquantes (moyennes vectorisées en une passe)"""
+        if df is None:
+            return df
+        # mean(numeric_only=True) calcule toutes les moyennes en un seul
+        # passage C et laisse les colonnes non numériques intactes
+        return df.fillna(df.mean(numeric_only=True))
 ''',
         
         'transform/encoding.py': '''
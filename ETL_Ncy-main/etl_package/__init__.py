@@ -1,2 +1,9 @@
 # Package init
+import pandas as pd
+
+# Copy-on-Write: rend les copies superficielles des transformations sûres
+# (toujours actif à partir de pandas 3.0, option nécessaire en 2.x)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 __all__ = ["extract", "transform", "load", "pipelines", "utils"]
@@ -3,12 +3,18 @@ Module de configuration pour les paramètres de connexion aux bases de données
 et autres paramètres globaux de l'application.
 """
 
+import functools
 import os
 from dotenv import load_dotenv
 from pathlib import Path
 
+@functools.lru_cache(maxsize=1)
 def load_environment():
-    """Charge les variables d'environnement avec gestion d'erreurs"""
+    """
+    Charge les variables d'environnement avec gestion d'erreurs.
+    Mis en cache: les appels suivants (rechargements, imports multiples)
+    ne refont ni les stat() des chemins candidats ni le parsing du .env.
+    """
     try:
         # Essayer plusieurs chemins possibles
         possible_paths = [
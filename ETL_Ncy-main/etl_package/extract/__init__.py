@@ -1,4 +1,4 @@
 # etl_package/extract/__init__.py
-from .web_scraper import scrape_cacao_ratings
+from .web_scraper import scrape_cacao_ratings, scrape_many
 
-__all__ = ["scrape_cacao_ratings"]
+__all__ = ["scrape_cacao_ratings", "scrape_many"]
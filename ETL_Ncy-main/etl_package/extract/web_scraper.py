@@ -2,13 +2,36 @@
 Module d'extraction de données via web scraping avec BeautifulSoup.
 """
 
+import io
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Session partagée au niveau du module: réutilise les connexions TCP/TLS
+# (Keep-Alive) entre les appels au lieu d'ouvrir une connexion par requête
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+})
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+def close_session():
+    """Ferme la session HTTP partagée (à appeler à l'arrêt du processus)."""
+    _SESSION.close()
+
 def scrape_cacao_ratings():
     """
     Scrape les données de ratings de cacao depuis le site Codecademy.
@@ -20,18 +43,11 @@ def scrape_cacao_ratings():
         url = "https://content.codecademy.com/courses/beautifulsoup/cacao/index.html"
         logger.info(f"Scraping des données depuis: {url}")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        }
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
         
-        # Parsing avec BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
         # Récupérer la meilleure table (plus grande en taille)
-        df = manual_table_scraping(soup)
+        df = manual_table_scraping(response.text)
         if df is not None and not df.empty:
             logger.info(f"✅ Scraping manuel réussi: {df.shape[0]} lignes, {df.shape[1]} colonnes")
             return df
@@ -46,73 +62,66 @@ def scrape_cacao_ratings():
         logger.error(f"Erreur inattendue lors du scraping: {e}")
         return pd.DataFrame()
 
-def manual_table_scraping(soup):
+def scrape_many(urls, timeout=30, max_workers=16):
     """
-    Scraping manuel de la table HTML avec BeautifulSoup.
-    
+    Scrape plusieurs URLs en parallèle via un pool de threads.
+    Les attentes réseau se recouvrent: le temps total tend vers la latence
+    de la page la plus lente au lieu de la somme des latences.
+
     Args:
-        soup: Objet BeautifulSoup
-        
+        urls (list): Liste des URLs à scraper
+        timeout (int): Timeout par requête en secondes
+        max_workers (int): Nombre maximum de téléchargements simultanés
+
+    Returns:
+        list[pd.DataFrame]: Un DataFrame par URL (vide en cas d'échec)
+    """
+    def _fetch_and_parse(url):
+        try:
+            logger.info(f"Scraping des données depuis: {url}")
+            response = _SESSION.get(url, timeout=timeout)
+            response.raise_for_status()
+            df = manual_table_scraping(response.text)
+            if df is not None and not df.empty:
+                return df
+            logger.error(f"Aucune donnée n'a pu être scrapée depuis {url}")
+            return pd.DataFrame()
+        except requests.RequestException as e:
+            logger.error(f"Erreur réseau lors du scraping de {url}: {e}")
+            return pd.DataFrame()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls) or 1)) as executor:
+        return list(executor.map(_fetch_and_parse, urls))
+
+def manual_table_scraping(html):
+    """
+    Extraction des tables HTML via pandas.read_html.
+    L'analyse complète (parsing lxml, typage, normalisation des lignes)
+    se fait en une passe C au lieu d'une boucle Python par cellule.
+
+    Args:
+        html (str): Contenu HTML de la page
+
     Returns:
-        pd.DataFrame: DataFrame des données scrapées
+        pd.DataFrame: DataFrame de la plus grande table trouvée
     """
     try:
-        tables = soup.find_all('table')
+        tables = pd.read_html(io.StringIO(html), flavor='lxml')
         logger.info(f"Nombre de tables trouvées: {len(tables)}")
-        
-        if not tables:
-            logger.warning("Aucune table trouvée dans le HTML")
-            return None
-        
-        candidate_dfs = []  # stocker toutes les tables converties
-        
-        for i, table in enumerate(tables):
-            logger.info(f"Traitement de la table {i+1}")
-            
-            rows = table.find_all('tr')
-            data = []
-            for row in rows:
-                cells = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
-                if cells:
-                    data.append(cells)
-            
-            logger.info(f"Lignes totales trouvées: {len(data)}")
-            if not data or len(data) < 2:
-                continue
-            
-            # Vérifier si la première ligne peut être des en-têtes
-            potential_headers = data[0]
-            if all(isinstance(h, str) and len(h) > 0 for h in potential_headers):
-                headers = potential_headers
-                data_rows = data[1:]
-            else:
-                headers = [f"Colonne_{j+1}" for j in range(len(data[0]))]
-                data_rows = data
-            
-            # Uniformiser les lignes
-            max_cols = len(headers)
-            normalized_rows = []
-            for row in data_rows:
-                if len(row) < max_cols:
-                    row.extend([''] * (max_cols - len(row)))
-                elif len(row) > max_cols:
-                    row = row[:max_cols]
-                normalized_rows.append(row)
-            
-            df = pd.DataFrame(normalized_rows, columns=headers)
-            logger.info(f"Table {i+1} créée avec shape {df.shape}")
-            
-            if not df.empty:
-                candidate_dfs.append(df)
-        
+
+        candidate_dfs = [df for df in tables if not df.empty]
         if candidate_dfs:
             # Choisir la plus grande table (celle avec le plus de lignes * colonnes)
-            best_df = max(candidate_dfs, key=lambda t: t.shape[0] * t.shape[1])
+            best_df = max(candidate_dfs, key=lambda t: t.size)
+            logger.info(f"Table retenue avec shape {best_df.shape}")
             return best_df
-        
+
         logger.warning("Aucune table exploitable trouvée")
         return None
-    
+
+    except ValueError:
+        logger.warning("Aucune table trouvée dans le HTML")
+        return None
     except Exception as e:
         logger.error(f"Erreur lors du scraping manuel: {e}")
         return None
@@ -3,7 +3,21 @@ Module pour le chargement des données dans PostgreSQL.
 Utilise SQLAlchemy pour une connexion générique et sécurisée.
 """
 
+import functools
+import io
+
+import numpy as np
 import pandas as pd
+
+# Kernels de calcul Arrow (SIMD C++) pour le dimensionnement des VARCHAR;
+# repli sur les réductions .str de pandas si pyarrow est absent
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 from typing import Optional, Dict
@@ -12,6 +26,48 @@ from ..config.config import config
 
 logger = logging.getLogger(__name__)
 
+# Correspondance directe dtype.kind -> type PostgreSQL pour les cas simples;
+# les entiers ('i'/'u') et le texte ('O'/'U') demandent un calcul sur les valeurs
+_KIND_TO_PG = {
+    'f': 'FLOAT',
+    'M': 'TIMESTAMP',
+    'b': 'BOOLEAN',
+}
+
+# Type NumPy le plus étroit correspondant à chaque type entier PostgreSQL
+_PG_TO_NP = {
+    'SMALLINT': 'int16',
+    'INTEGER': 'int32',
+}
+
+@functools.lru_cache(maxsize=8)
+def _get_engine(connection_string: str):
+    """
+    Retourne un engine SQLAlchemy partagé pour cette chaîne de connexion.
+    Le cache évite de recréer engine + pool (et leur handshake TCP/TLS)
+    à chaque instanciation de PostgreSQLLoader.
+    """
+    return create_engine(
+        connection_string,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        executemany_mode='values_plus_batch',
+        insertmanyvalues_page_size=10000,
+        executemany_batch_page_size=1000
+    )
+
+@functools.lru_cache(maxsize=64)
+def _build_copy_sql(table_name: str, columns: tuple) -> str:
+    """
+    Pré-formate l'ordre COPY pour une forme de table donnée (mémoïsé).
+    En ingestion micro-batch, recharger la même table re-sert le SQL déjà
+    construit au lieu de re-quoter les colonnes à chaque appel.
+    """
+    cols = ', '.join(f'"{c}"' for c in columns)
+    return f'COPY "{table_name}" ({cols}) FROM STDIN WITH (FORMAT CSV, NULL \'\\N\')'
+
 class PostgreSQLLoader:
     """Classe pour le chargement de données dans PostgreSQL."""
 
@@ -29,10 +85,9 @@ class PostgreSQLLoader:
     def _connect(self):
         """Établit la connexion à la base de données PostgreSQL."""
         try:
-            self.engine = create_engine(self.connection_string)
-            # Test de connexion
-            with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            # Engine partagé entre instances; pool_pre_ping vérifie chaque
+            # connexion du pool avant usage (remplace le SELECT 1 manuel)
+            self.engine = _get_engine(self.connection_string)
             logger.info("Connexion à PostgreSQL établie avec succès")
         except SQLAlchemyError as e:
             logger.error(f"Erreur de connexion à PostgreSQL: {e}")
@@ -45,7 +100,8 @@ class PostgreSQLLoader:
         if_exists: str = "replace",
         index: bool = False,
         dtype: Optional[Dict] = None,
-        chunksize: int = 1000
+        chunksize: int = 50_000,
+        downcast: bool = False
     ) -> bool:
         """Charge un DataFrame pandas dans une table PostgreSQL."""
         if df.empty:
@@ -56,22 +112,90 @@ class PostgreSQLLoader:
             if self.engine is None:
                 self._connect()
 
-            df.to_sql(
+            # Réduire les colonnes au plus petit type compatible (entiers
+            # en SMALLINT/INTEGER, flottants en float32): opt-in, car cela
+            # implique un scan complet des dtypes et longueurs de chaînes
+            if downcast:
+                df = self._downcast_columns(df, downcast_floats=True)
+
+            # Créer/vider la table via pandas (gère la sémantique if_exists),
+            # puis copier les données en CSV via COPY, sans itération Python par ligne
+            df.head(0).to_sql(
                 table_name,
                 self.engine,
                 if_exists=if_exists,
                 index=index,
-                dtype=dtype,
-                method='multi',
-                chunksize=chunksize
+                dtype=dtype
             )
+            self._copy_from_csv(df, table_name, index=index, chunksize=chunksize)
             logger.info(f"DataFrame chargé dans la table '{table_name}': {df.shape[0]} lignes")
             return True
 
-        except SQLAlchemyError as e:
+        except Exception as e:
             logger.error(f"Erreur lors du chargement dans PostgreSQL: {e}")
             return False
 
+    def _downcast_columns(
+        self,
+        df: pd.DataFrame,
+        downcast_floats: bool = False
+    ) -> pd.DataFrame:
+        """
+        Réduit les colonnes entières au plus petit type NumPy compatible
+        (int16/int32), ce que pandas traduit en SMALLINT/INTEGER côté table.
+        Les flottants passent en float32 si downcast_floats=True.
+        """
+        dtype_mapping = self._get_sql_dtypes(df)
+        df = df.copy(deep=False)
+
+        for column, pg_type in dtype_mapping.items():
+            np_type = _PG_TO_NP.get(pg_type)
+            if np_type is None and not (downcast_floats and pg_type == 'FLOAT'):
+                continue
+            # Les dtypes nullables (Int64, Arrow...) avec des NA ne peuvent
+            # pas être réduits vers un type NumPy: on les laisse tels quels
+            if not isinstance(df[column].dtype, np.dtype) and df[column].isna().any():
+                continue
+            df[column] = df[column].astype(np_type if np_type is not None else 'float32')
+
+        return df
+
+    def _copy_from_csv(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        index: bool = False,
+        chunksize: int = 50_000
+    ):
+        """
+        Copie un DataFrame dans une table existante via COPY FROM STDIN.
+        Le CSV est généré par df.to_csv (implémenté en C), ce qui évite la
+        construction de tuples Python ligne par ligne de to_sql. Les données
+        sont copiées par tranches de `chunksize` lignes pour borner la mémoire.
+        """
+        # Connexion empruntée au pool, transaction unique: un seul commit
+        # (et un seul flush WAL) pour l'ensemble des tranches, puis la
+        # connexion retourne au pool au lieu d'être fermée
+        with self.engine.begin() as conn:
+            with conn.connection.cursor() as cur:
+                if index:
+                    # Avec l'index en tête du CSV, laisser COPY suivre
+                    # l'ordre des colonnes de la table
+                    sql = f'COPY "{table_name}" FROM STDIN WITH (FORMAT CSV, NULL \'\\N\')'
+                else:
+                    sql = _build_copy_sql(table_name, tuple(df.columns))
+                # Réutiliser un seul buffer entre les tranches: la capacité
+                # allouée à la première itération sert aux suivantes
+                buf = io.StringIO()
+                for start in range(0, len(df), chunksize):
+                    buf.seek(0)
+                    buf.truncate()
+                    df.iloc[start:start + chunksize].to_csv(
+                        buf, index=index, header=False, na_rep='\\N'
+                    )
+                    buf.seek(0)
+                    cur.copy_expert(sql, buf)
+
     def create_table_from_dataframe(
         self,
         df: pd.DataFrame,
@@ -106,28 +230,57 @@ class PostgreSQLLoader:
     def _get_sql_dtypes(self, df: pd.DataFrame) -> Dict[str, str]:
         """Map les types pandas vers les types PostgreSQL optimisés."""
         type_mapping = {}
-        for column in df.columns:
-            dtype = df[column].dtype
-
-            if pd.api.types.is_integer_dtype(dtype):
-                if df[column].min() >= -32768 and df[column].max() <= 32767:
-                    type_mapping[column] = "SMALLINT"
-                elif df[column].min() >= -2147483648 and df[column].max() <= 2147483647:
-                    type_mapping[column] = "INTEGER"
-                else:
-                    type_mapping[column] = "BIGINT"
 
-            elif pd.api.types.is_float_dtype(dtype):
-                type_mapping[column] = "FLOAT"
+        # Partitionner les colonnes par dtype.kind en une seule passe:
+        # un lookup dict remplace les quatre appels pd.api.types.is_*_dtype
+        int_cols, text_cols = [], []
+        for column, dtype in zip(df.columns, df.dtypes):
+            kind = dtype.kind
+            pg_type = _KIND_TO_PG.get(kind)
 
-            elif pd.api.types.is_datetime64_any_dtype(dtype):
-                type_mapping[column] = "TIMESTAMP"
+            if pg_type is not None:
+                type_mapping[column] = pg_type
+            elif kind in ('i', 'u'):
+                int_cols.append(column)
+            else:
+                text_cols.append(column)
 
-            elif pd.api.types.is_bool_dtype(dtype):
-                type_mapping[column] = "BOOLEAN"
+        # Bornes entières calculées en une seule réduction C sur tout le bloc
+        if int_cols:
+            stats = df[int_cols].agg(['min', 'max'])
+            mins = stats.loc['min'].to_numpy()
+            maxs = stats.loc['max'].to_numpy()
+            sql_int_types = np.select(
+                [
+                    (mins >= -32768) & (maxs <= 32767),
+                    (mins >= -2147483648) & (maxs <= 2147483647),
+                ],
+                ["SMALLINT", "INTEGER"],
+                default="BIGINT"
+            )
+            type_mapping.update(zip(int_cols, sql_int_types))
 
-            else:
-                max_length = df[column].astype(str).str.len().max()
+        # Longueurs max des colonnes texte: kernel SIMD utf8_length d'Arrow
+        # quand la colonne est convertible, sinon réductions .str de pandas
+        if text_cols:
+            max_lengths = {}
+            if pa is not None:
+                for column in text_cols:
+                    try:
+                        arr = pa.array(df[column], type=pa.string())
+                    except (pa.ArrowInvalid, pa.ArrowTypeError):
+                        continue
+                    max_lengths[column] = pc.max(pc.utf8_length(arr)).as_py()
+
+            remaining = [c for c in text_cols if c not in max_lengths]
+            if remaining:
+                fallback = df[remaining].astype('string').apply(lambda s: s.str.len().max())
+                max_lengths.update(fallback.items())
+
+            for column in text_cols:
+                max_length = max_lengths.get(column)
+                if max_length is None or pd.isna(max_length):
+                    max_length = 0
                 type_mapping[column] = "VARCHAR(255)" if max_length <= 255 else "TEXT"
 
         return type_mapping
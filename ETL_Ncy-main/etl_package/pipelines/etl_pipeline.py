@@ -22,6 +22,14 @@ class ETLPipeline:
     Classe principale pour l'orchestration du pipeline ETL.
     Modulaire et réutilisable pour différents projets.
     """
+    # Table de dispatch des transformations: un lookup remplace la chaîne
+    # if/elif et permet d'ajouter une transformation sans toucher transform()
+    _TRANSFORMATIONS = {
+        'handle_missing_values': MissingValuesHandler.impute_missing_values,
+        'encode_categorical': DataEncoder.one_hot_encode,
+        'create_features': FeatureEngineer.create_date_features,
+    }
+
     def __init__(self, config: dict = None):
         self.config = config or {}
         self.raw_data = None
@@ -36,45 +44,68 @@ class ETLPipeline:
                 self.raw_data = scrape_cacao_ratings()
             else:
                 raise ValueError(f"Source non supportée: {source}")
-            
+
+            # Dtypes Arrow: les chaînes passent d'objets Python à des buffers
+            # UTF-8 contigus — scans et encodages bien plus rapides, mémoire
+            # réduite. Ignoré silencieusement si pyarrow n'est pas installé.
+            try:
+                self.raw_data = self.raw_data.convert_dtypes(dtype_backend='pyarrow')
+            except ImportError:
+                pass
+
             logger.info(f"Extraction terminée: {self.raw_data.shape[0]} lignes, {self.raw_data.shape[1]} colonnes")
             return self.raw_data
         except Exception as e:
             logger.error(f"Erreur lors de l'extraction: {e}")
             raise
 
-    def transform(self, transformations: list) -> pd.DataFrame:
+    def _apply_transformation(self, df: pd.DataFrame, transformation: dict) -> pd.DataFrame:
+        """Applique une transformation du plan à un DataFrame et le retourne."""
+        func_name = transformation['function']
+        params = transformation.get('params', {})
+
+        logger.info(f"Application de la transformation: {func_name}")
+        handler = self._TRANSFORMATIONS.get(func_name)
+        if handler is not None:
+            return handler(df, **params)
+        elif func_name == 'validate_data':
+            validator = DataValidator()
+            result = validator.validate_data_types(df, **params)
+            if not result['valid']:
+                logger.warning(f"Problèmes de validation: {result['errors']}")
+        else:
+            logger.warning(f"Transformation non reconnue: {func_name}")
+        return df
+
+    def transform(self, transformations: list, chunk_rows: int = None) -> pd.DataFrame:
         if self.raw_data is None:
             raise ValueError("Aucune donnée à transformer. Exécutez d'abord extract().")
-        
+
         logger.info("Début de la phase de transformation")
-        self.transformed_data = self.raw_data.copy()
         try:
-            for transformation in transformations:
-                func_name = transformation['function']
-                params = transformation.get('params', {})
-
-                logger.info(f"Application de la transformation: {func_name}")
-                if func_name == 'handle_missing_values':
-                    self.transformed_data = MissingValuesHandler.impute_missing_values(
-                        self.transformed_data, **params
-                    )
-                elif func_name == 'encode_categorical':
-                    self.transformed_data = DataEncoder.one_hot_encode(
-                        self.transformed_data, **params
-                    )
-                elif func_name == 'validate_data':
-                    validator = DataValidator()
-                    result = validator.validate_data_types(self.transformed_data, **params)
-                    if not result['valid']:
-                        logger.warning(f"Problèmes de validation: {result['errors']}")
-                elif func_name == 'create_features':
-                    self.transformed_data = FeatureEngineer.create_date_features(
-                        self.transformed_data, **params
+            if chunk_rows and len(self.raw_data) > chunk_rows:
+                # Tuilage par blocs de lignes: chaque bloc traverse tous les
+                # étages tant qu'il est encore chaud en cache, au lieu de
+                # relire tout le frame depuis la RAM à chaque étage.
+                # À réserver aux transformations ligne-à-ligne: les
+                # statistiques globales (moyennes, classes d'encodage...)
+                # seraient calculées par bloc et non sur tout le jeu.
+                chunks = []
+                for start in range(0, len(self.raw_data), chunk_rows):
+                    chunk = self.raw_data.iloc[start:start + chunk_rows]
+                    for transformation in transformations:
+                        chunk = self._apply_transformation(chunk, transformation)
+                    chunks.append(chunk)
+                self.transformed_data = pd.concat(chunks, ignore_index=True)
+            else:
+                # Copie superficielle: sous Copy-on-Write les transformations
+                # ne mutent jamais leur entrée, inutile de dupliquer le frame
+                self.transformed_data = self.raw_data.copy(deep=False)
+                for transformation in transformations:
+                    self.transformed_data = self._apply_transformation(
+                        self.transformed_data, transformation
                     )
-                else:
-                    logger.warning(f"Transformation non reconnue: {func_name}")
-            
+
             logger.info(f"Transformation terminée: {self.transformed_data.shape[1]} colonnes")
             return self.transformed_data
         except Exception as e:
@@ -90,10 +121,14 @@ class ETLPipeline:
             if destination == 'postgres':
                 table_name = kwargs.get('table_name', 'cacao_ratings')
                 self.loader = PostgreSQLLoader()
+                # load_dataframe passe par COPY FROM STDIN; relayer les
+                # réglages d'ingestion (taille de tranche, downcast)
                 success = self.loader.load_dataframe(
-                    self.transformed_data, 
+                    self.transformed_data,
                     table_name=table_name,
-                    if_exists=kwargs.get('if_exists', 'replace')
+                    if_exists=kwargs.get('if_exists', 'replace'),
+                    chunksize=kwargs.get('chunksize', 50_000),
+                    downcast=kwargs.get('downcast', False)
                 )
             else:
                 raise ValueError(f"Destination non supportée: {destination}")
@@ -0,0 +1,30 @@
+"""
+Utilitaires internes partagés par les modules de transformation.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def numeric_columns(df: pd.DataFrame,
+                    requested: Optional[List[str]] = None) -> List[str]:
+    """
+    Retourne les colonnes numériques de `df`, filtrées sur `requested`.
+
+    Une seule passe select_dtypes sur le block manager, au lieu d'un
+    is_numeric_dtype par colonne dans une boucle Python.
+
+    Args:
+        df (pd.DataFrame): DataFrame source
+        requested (list): Sous-ensemble demandé (toutes si None)
+
+    Returns:
+        list: Colonnes numériques, dans l'ordre de `requested`
+    """
+    numeric = df.select_dtypes(include=[np.number]).columns
+    if requested is None:
+        return numeric.tolist()
+    numeric_set = set(numeric)
+    return [column for column in requested if column in numeric_set]
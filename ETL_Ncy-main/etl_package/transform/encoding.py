@@ -3,8 +3,8 @@ Module pour l'encodage des variables catégorielles.
 Implémente one-hot encoding et label encoding de manière générique.
 """
 
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder
 from typing import List, Optional, Dict
 import logging
 
@@ -14,7 +14,11 @@ class DataEncoder:
     """
     Classe pour l'encodage des variables catégorielles.
     """
-    
+
+    # Correspondances colonne -> classes issues de factorize, réutilisables
+    # pour encoder de nouvelles valeurs avec le même mapping (get_indexer)
+    _label_mappings: Dict[str, pd.Index] = {}
+
     @staticmethod
     def one_hot_encode(df: pd.DataFrame, 
                       columns: Optional[List[str]] = None,
@@ -30,18 +34,25 @@ class DataEncoder:
         Returns:
             pd.DataFrame: DataFrame encodé
         """
-        df_encoded = df.copy()
-        
         if columns is None:
-            columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
-        
-        for column in columns:
-            if column in df.columns:
-                dummies = pd.get_dummies(df[column], prefix=column, drop_first=drop_first)
-                df_encoded = pd.concat([df_encoded, dummies], axis=1)
-                df_encoded.drop(column, axis=1, inplace=True)
-                logger.info(f"Colonne '{column}' encodée en one-hot ({len(dummies.columns)} nouvelles colonnes)")
-        
+            columns = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
+        columns = [column for column in columns if column in df.columns]
+
+        if not columns:
+            return df.copy(deep=False)
+
+        # Un seul get_dummies sur tout le frame: tous les blocs dummies sont
+        # construits et concaténés en une passe, au lieu d'un pd.concat qui
+        # recopie le frame entier à chaque colonne. sparse quand le résultat
+        # serait trop large pour du dense (1 bit/cellule au lieu d'1 octet).
+        cardinality = sum(df[column].nunique() for column in columns)
+        sparse = cardinality * df.shape[0] > 10_000_000
+        df_encoded = pd.get_dummies(
+            df, columns=columns, drop_first=drop_first, dtype=np.uint8, sparse=sparse
+        )
+
+        new_columns = df_encoded.shape[1] - (df.shape[1] - len(columns))
+        logger.info(f"{len(columns)} colonnes encodées en one-hot ({new_columns} nouvelles colonnes)")
         return df_encoded
     
     @staticmethod
@@ -57,17 +68,20 @@ class DataEncoder:
         Returns:
             pd.DataFrame: DataFrame encodé
         """
-        df_encoded = df.copy()
-        label_encoder = LabelEncoder()
-        
+        df_encoded = df.copy(deep=False)
+
         if columns is None:
-            columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
-        
+            columns = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
+
         for column in columns:
             if column in df.columns:
-                df_encoded[column] = label_encoder.fit_transform(df[column].astype(str))
-                logger.info(f"Colonne '{column}' encodée en labels ({len(label_encoder.classes_)} classes)")
-        
+                # factorize: une seule passe de hachage en C, sans la copie
+                # astype(str) ni l'enrobage sklearn
+                codes, uniques = pd.factorize(df[column], use_na_sentinel=True)
+                DataEncoder._label_mappings[column] = pd.Index(uniques)
+                df_encoded[column] = codes
+                logger.info(f"Colonne '{column}' encodée en labels ({len(uniques)} classes)")
+
         return df_encoded
     
     @staticmethod
@@ -83,15 +97,25 @@ class DataEncoder:
         Returns:
             pd.DataFrame: DataFrame encodé
         """
-        df_encoded = df.copy()
+        df_encoded = df.copy(deep=False)
         
         if columns is None:
-            columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
+            columns = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
         
         for column in columns:
             if column in df.columns:
-                freq_map = df[column].value_counts(normalize=True).to_dict()
-                df_encoded[column] = df[column].map(freq_map)
+                # Un bincount sur les codes factorisés puis un gather NumPy
+                # remplacent le dict Python de value_counts + .map()
+                codes, uniques = pd.factorize(df[column], use_na_sentinel=True)
+                if len(uniques) == 0:
+                    # Colonne entièrement manquante: aucune fréquence à
+                    # calculer, même résultat que value_counts + map
+                    df_encoded[column] = np.nan
+                    logger.info(f"Colonne '{column}' encodée par fréquence")
+                    continue
+                counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+                freqs = counts / counts.sum()
+                df_encoded[column] = np.where(codes >= 0, freqs[codes], np.nan)
                 logger.info(f"Colonne '{column}' encodée par fréquence")
         
         return df_encoded
\ No newline at end of file
@@ -9,6 +9,8 @@ from typing import List, Optional, Dict, Any
 import logging
 from datetime import datetime
 
+from etl_package.transform._utils import numeric_columns
+
 logger = logging.getLogger(__name__)
 
 class FeatureEngineer:
@@ -29,20 +31,42 @@ class FeatureEngineer:
         Returns:
             pd.DataFrame: DataFrame avec les nouvelles features
         """
-        df_engineered = df.copy()
+        df_engineered = df.copy(deep=False)
         
         if date_column in df.columns:
-            # Convertir en datetime si ce n'est pas déjà fait
-            df_engineered[date_column] = pd.to_datetime(df[date_column])
-            
-            # Extraire différentes composantes temporelles
-            df_engineered[f'{date_column}_year'] = df_engineered[date_column].dt.year
-            df_engineered[f'{date_column}_month'] = df_engineered[date_column].dt.month
-            df_engineered[f'{date_column}_day'] = df_engineered[date_column].dt.day
-            df_engineered[f'{date_column}_dayofweek'] = df_engineered[date_column].dt.dayofweek
-            df_engineered[f'{date_column}_quarter'] = df_engineered[date_column].dt.quarter
-            df_engineered[f'{date_column}_is_weekend'] = df_engineered[date_column].dt.dayofweek.isin([5, 6]).astype(int)
-            
+            # Convertir en datetime si ce n'est pas déjà fait. Sans format=,
+            # pandas infère le format chaîne par chaîne (heuristique Python);
+            # le parseur C ISO8601 + cache=True (dédoublonnage par hachage
+            # des chaînes répétées) est bien plus rapide, avec repli 'mixed'
+            # pour les formats hétérogènes
+            if pd.api.types.is_datetime64_any_dtype(df[date_column]):
+                df_engineered[date_column] = df[date_column]
+            else:
+                try:
+                    df_engineered[date_column] = pd.to_datetime(
+                        df[date_column], format='ISO8601', cache=True
+                    )
+                except ValueError:
+                    df_engineered[date_column] = pd.to_datetime(
+                        df[date_column], format='mixed', cache=True
+                    )
+
+            # Extraire toutes les composantes depuis un seul DatetimeIndex
+            # (une passe sur le buffer int64, pas six accès .dt), avec des
+            # types de sortie étroits pour limiter la bande passante mémoire
+            dt = pd.DatetimeIndex(df_engineered[date_column])
+            dayofweek = dt.dayofweek
+            # Les types étroits ne supportent pas NaT: on les réserve aux
+            # colonnes sans valeur manquante
+            narrow = not dt.hasnans
+            df_engineered[f'{date_column}_year'] = dt.year.astype(np.int16) if narrow else dt.year
+            df_engineered[f'{date_column}_month'] = dt.month.astype(np.int8) if narrow else dt.month
+            df_engineered[f'{date_column}_day'] = dt.day.astype(np.int8) if narrow else dt.day
+            df_engineered[f'{date_column}_dayofweek'] = dayofweek.astype(np.int8) if narrow else dayofweek
+            df_engineered[f'{date_column}_quarter'] = dt.quarter.astype(np.int8) if narrow else dt.quarter
+            # Comparaison sans branchement, équivalente à isin([5, 6])
+            df_engineered[f'{date_column}_is_weekend'] = (dayofweek >= 5).astype(np.uint8)
+
             logger.info(f"Features temporelles créées à partir de {date_column}")
         
         return df_engineered
@@ -60,17 +84,23 @@ class FeatureEngineer:
         Returns:
             pd.DataFrame: DataFrame avec features d'interaction
         """
-        df_engineered = df.copy()
-        numeric_columns = [col for col in columns if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
-        
-        # Créer des interactions pour les paires de colonnes
-        for i, col1 in enumerate(numeric_columns):
-            for j, col2 in enumerate(numeric_columns):
-                if i < j:  # Éviter les doublons
-                    interaction_name = f"{col1}_x_{col2}"
-                    df_engineered[interaction_name] = df[col1] * df[col2]
-        
-        logger.info(f"Features d'interaction créées pour {len(numeric_columns)} colonnes")
+        df_engineered = df.copy(deep=False)
+        valid_columns = numeric_columns(df, columns)
+
+        if len(valid_columns) >= 2:
+            # Tous les produits de paires en une seule multiplication NumPy
+            # vectorisée (float64: les entiers > 2^24 ne tiennent pas dans
+            # la mantisse float32), puis un seul concat au lieu d'un par paire
+            X = df[valid_columns].to_numpy(dtype=np.float64)
+            i, j = np.triu_indices(len(valid_columns), k=1)
+            products = X[:, i] * X[:, j]
+            names = [f"{valid_columns[a]}_x_{valid_columns[b]}" for a, b in zip(i, j)]
+            df_engineered = pd.concat(
+                [df_engineered, pd.DataFrame(products, index=df.index, columns=names)],
+                axis=1
+            )
+
+        logger.info(f"Features d'interaction créées pour {len(valid_columns)} colonnes")
         return df_engineered
     
     @staticmethod
@@ -88,14 +118,24 @@ class FeatureEngineer:
         Returns:
             pd.DataFrame: DataFrame avec features polynomiales
         """
-        df_engineered = df.copy()
-        
-        for column in columns:
-            if column in df.columns and pd.api.types.is_numeric_dtype(df[column]):
-                for deg in range(2, degree + 1):
-                    poly_name = f"{column}_pow_{deg}"
-                    df_engineered[poly_name] = df[column] ** deg
-        
+        df_engineered = df.copy(deep=False)
+        valid_columns = numeric_columns(df, columns)
+
+        if valid_columns and degree >= 2:
+            # Multiplications itérées sur tout le bloc (x2 = x*x, x3 = x2*x...):
+            # une multiplication vectorisée par degré pour toutes les colonnes,
+            # au lieu d'un pow libm par élément et par degré
+            X = df[valid_columns].to_numpy(dtype=np.float64)
+            acc = X.copy()
+            blocks = []
+            for deg in range(2, degree + 1):
+                acc = acc * X
+                blocks.append(pd.DataFrame(
+                    acc, index=df.index,
+                    columns=[f"{col}_pow_{deg}" for col in valid_columns]
+                ))
+            df_engineered = pd.concat([df_engineered] + blocks, axis=1)
+
         logger.info(f"Features polynomiales créées (degré {degree})")
         return df_engineered
     
@@ -116,17 +156,30 @@ class FeatureEngineer:
         Returns:
             pd.DataFrame: DataFrame avec features binnées
         """
-        df_engineered = df.copy()
-        
-        for column in columns:
-            if column in df.columns and pd.api.types.is_numeric_dtype(df[column]):
-                if strategy == 'quantile':
-                    df_engineered[f'{column}_binned'] = pd.qcut(df[column], bins, labels=False, duplicates='drop')
-                else:  # uniform
-                    df_engineered[f'{column}_binned'] = pd.cut(df[column], bins, labels=False)
-                
-                logger.info(f"Colonne '{column}' binnée en {bins} catégories")
-        
+        df_engineered = df.copy(deep=False)
+
+        for column in numeric_columns(df, columns):
+            # Bornes calculées une fois (quantiles introselect O(N) ou
+            # linspace), puis recherche binaire vectorisée: évite le tri
+            # complet et le Categorical intermédiaire de qcut/cut
+            x = df[column].to_numpy(dtype=np.float64)
+            if strategy == 'quantile':
+                edges = np.unique(np.nanquantile(x, np.linspace(0, 1, bins + 1)))
+            else:  # uniform
+                edges = np.linspace(np.nanmin(x), np.nanmax(x), bins + 1)
+
+            codes = np.clip(np.searchsorted(edges, x, side='right') - 1, 0, len(edges) - 2)
+            mask = np.isnan(x)
+            if mask.any():
+                # Conserver les NaN comme qcut/cut (codes en flottant)
+                codes = codes.astype(np.float32)
+                codes[mask] = np.nan
+                df_engineered[f'{column}_binned'] = codes
+            else:
+                df_engineered[f'{column}_binned'] = codes.astype(np.int8)
+
+            logger.info(f"Colonne '{column}' binnée en {bins} catégories")
+
         return df_engineered
     
     @staticmethod
@@ -146,21 +199,92 @@ class FeatureEngineer:
         Returns:
             pd.DataFrame: DataFrame avec features agrégées
         """
-        df_engineered = df.copy()
+        df_engineered = df.copy(deep=False)
         
         # Vérifier que les colonnes existent
         valid_groupby = [col for col in groupby_columns if col in df.columns]
-        valid_agg = [col for col in agg_columns if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
+        valid_agg = numeric_columns(df, agg_columns)
         
         if valid_groupby and valid_agg:
-            # Calculer les agrégations
-            aggregation = df.groupby(valid_groupby)[valid_agg].agg(agg_functions)
-            aggregation.columns = [f"{col}_{func}" for col, func in aggregation.columns]
-            aggregation = aggregation.reset_index()
-            
-            # Fusionner avec le DataFrame original
-            df_engineered = df_engineered.merge(aggregation, on=valid_groupby, how='left')
-            
+            stats = FeatureEngineer._reduceat_group_stats(
+                df, valid_groupby, valid_agg, agg_functions
+            )
+            if stats is not None:
+                for func, block in stats:
+                    for k, col in enumerate(valid_agg):
+                        df_engineered[f"{col}_{func}"] = block[:, k]
+            else:
+                # Repli pandas: transform diffuse chaque statistique sur les
+                # lignes (chemin Cython pour mean/std/min/max...), sans merge
+                # ni frame intermédiaire agg+reset_index
+                grouped = df.groupby(valid_groupby, sort=False, observed=True)
+                for func in agg_functions:
+                    transformed = grouped[valid_agg].transform(func)
+                    for col in valid_agg:
+                        df_engineered[f"{col}_{func}"] = transformed[col]
+
             logger.info(f"Features d'agrégation créées pour {len(valid_agg)} colonnes")
-        
-        return df_engineered
\ No newline at end of file
+
+        return df_engineered
+
+    @staticmethod
+    def _reduceat_group_stats(df: pd.DataFrame,
+                              groupby_columns: List[str],
+                              agg_columns: List[str],
+                              agg_functions: List[str]):
+        """
+        Statistiques de groupe par reduceat sur codes triés, diffusées ligne
+        à ligne. Un seul tri des codes de groupe partagé par toutes les
+        statistiques, puis une réduction SIMD par statistique — pas de table
+        de hachage groupby ni de passe indépendante par fonction.
+
+        Retourne une liste de (fonction, bloc lignes x colonnes), ou None si
+        le chemin vectorisé ne s'applique pas (fonction non supportée, NaN
+        dans les valeurs ou dans les clés de groupe).
+        """
+        if not set(agg_functions) <= {'mean', 'std', 'min', 'max', 'sum'}:
+            return None
+
+        if len(groupby_columns) == 1:
+            codes, _ = pd.factorize(df[groupby_columns[0]], use_na_sentinel=True)
+        else:
+            # MultiIndex.factorize n'émet pas de sentinelle -1 pour les
+            # clés contenant un NaN: détecter ces lignes en amont
+            if df[groupby_columns].isna().any().any():
+                return None
+            codes, _ = pd.MultiIndex.from_frame(df[groupby_columns]).factorize()
+        if len(codes) == 0 or codes.min() < 0:
+            # Clés manquantes: groupby(dropna=True) les exclut, le repli
+            # pandas conserve cette sémantique
+            return None
+
+        X = df[agg_columns].to_numpy(dtype=np.float64)
+        if np.isnan(X).any():
+            return None
+
+        order = np.argsort(codes, kind='stable')
+        sorted_X = X[order]
+        boundaries = np.concatenate(([0], np.flatnonzero(np.diff(codes[order])) + 1))
+        counts = np.diff(np.append(boundaries, len(codes)))[:, None]
+        sums = np.add.reduceat(sorted_X, boundaries, axis=0)
+        means = sums / counts
+
+        results = []
+        for func in agg_functions:
+            if func == 'mean':
+                stats = means
+            elif func == 'sum':
+                stats = sums
+            elif func == 'min':
+                stats = np.minimum.reduceat(sorted_X, boundaries, axis=0)
+            elif func == 'max':
+                stats = np.maximum.reduceat(sorted_X, boundaries, axis=0)
+            else:  # std (ddof=1, comme pandas)
+                sumsq = np.add.reduceat(sorted_X * sorted_X, boundaries, axis=0)
+                var = (sumsq - counts * means ** 2) / np.maximum(counts - 1, 1)
+                stats = np.sqrt(np.maximum(var, 0.0))
+                stats[counts[:, 0] == 1] = np.nan
+            # Les codes factorize étant 0..k-1, la ligne g de reduceat
+            # correspond au groupe g: la diffusion est un simple gather
+            results.append((func, stats[codes]))
+        return results
\ No newline at end of file
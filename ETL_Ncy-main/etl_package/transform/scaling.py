@@ -9,6 +9,8 @@ from sklearn.preprocessing import MinMaxScaler, StandardScaler
 from typing import List, Optional
 import logging
 
+from etl_package.transform._utils import numeric_columns
+
 logger = logging.getLogger(__name__)
 
 class DataScaler:
@@ -17,92 +19,106 @@ class DataScaler:
     """
     
     @staticmethod
-    def min_max_scale(df: pd.DataFrame, 
+    def min_max_scale(df: pd.DataFrame,
                      columns: Optional[List[str]] = None,
-                     feature_range: tuple = (0, 1)) -> pd.DataFrame:
+                     feature_range: tuple = (0, 1),
+                     dtype: str = 'float32') -> pd.DataFrame:
         """
         Normalise les données entre une plage spécifiée (par défaut 0-1).
-        
+
         Args:
             df (pd.DataFrame): DataFrame à normaliser
             columns (list): Colonnes à normaliser (toutes les numériques par défaut)
             feature_range (tuple): Plage de normalisation
-            
+            dtype (str): Type de sortie ('float64', 'float32' ou 'int8';
+                'int8' quantifie la plage [0, 1] sur 0..127)
+
         Returns:
             pd.DataFrame: DataFrame normalisé
         """
-        df_scaled = df.copy()
-        
-        if columns is None:
-            columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        
-        scaler = MinMaxScaler(feature_range=feature_range)
-        
-        for column in columns:
-            if column in df.columns and pd.api.types.is_numeric_dtype(df[column]):
-                # Reshape pour sklearn
-                values = df[column].values.reshape(-1, 1)
-                scaled_values = scaler.fit_transform(values)
-                df_scaled[column] = scaled_values.flatten()
-                logger.info(f"Colonne '{column}' normalisée avec MinMaxScaler")
-        
+        df_scaled = df.copy(deep=False)
+
+        # Partition des dtypes en une seule passe sur le block manager
+        columns = numeric_columns(df, columns)
+
+        if columns:
+            # Un seul fit_transform sur tout le bloc numérique: la boucle C
+            # de sklearn traite toutes les colonnes en une passe, sans les
+            # reshape/copies par colonne
+            scaler = MinMaxScaler(feature_range=feature_range)
+            X = scaler.fit_transform(df[columns].to_numpy(dtype=np.float64))
+            # Les valeurs normalisées tiennent dans un type plus étroit:
+            # moitié (float32) ou un huitième (int8) des octets en aval
+            if dtype == 'int8':
+                # Quantification sur 0..127 (les NaN deviennent 0)
+                X = np.round(np.nan_to_num(X) * 127).astype(np.int8)
+            elif dtype != 'float64':
+                X = X.astype(dtype, copy=False)
+            df_scaled[columns] = X
+            logger.info(f"{len(columns)} colonnes normalisées avec MinMaxScaler ({dtype})")
+
         return df_scaled
     
     @staticmethod
-    def standard_scale(df: pd.DataFrame, 
-                      columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def standard_scale(df: pd.DataFrame,
+                      columns: Optional[List[str]] = None,
+                      dtype: str = 'float32') -> pd.DataFrame:
         """
         Standardise les données (moyenne=0, écart-type=1).
-        
+
         Args:
             df (pd.DataFrame): DataFrame à standardiser
             columns (list): Colonnes à standardiser
-            
+            dtype (str): Type de sortie ('float64' ou 'float32')
+
         Returns:
             pd.DataFrame: DataFrame standardisé
         """
-        df_scaled = df.copy()
-        
-        if columns is None:
-            columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        
-        scaler = StandardScaler()
-        
-        for column in columns:
-            if column in df.columns and pd.api.types.is_numeric_dtype(df[column]):
-                values = df[column].values.reshape(-1, 1)
-                scaled_values = scaler.fit_transform(values)
-                df_scaled[column] = scaled_values.flatten()
-                logger.info(f"Colonne '{column}' standardisée avec StandardScaler")
-        
+        df_scaled = df.copy(deep=False)
+
+        # Partition des dtypes en une seule passe sur le block manager
+        columns = numeric_columns(df, columns)
+
+        if columns:
+            scaler = StandardScaler()
+            X = scaler.fit_transform(df[columns].to_numpy(dtype=np.float64))
+            df_scaled[columns] = X.astype(dtype, copy=False)
+            logger.info(f"{len(columns)} colonnes standardisées avec StandardScaler ({dtype})")
+
         return df_scaled
     
     @staticmethod
-    def robust_scale(df: pd.DataFrame, 
-                    columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def robust_scale(df: pd.DataFrame,
+                    columns: Optional[List[str]] = None,
+                    dtype: str = 'float32') -> pd.DataFrame:
         """
         Échelle robuste utilisant les quartiles (résistant aux outliers).
-        
+
         Args:
             df (pd.DataFrame): DataFrame à transformer
             columns (list): Colonnes à transformer
-            
+            dtype (str): Type de sortie ('float64' ou 'float32')
+
         Returns:
             pd.DataFrame: DataFrame transformé
         """
-        df_scaled = df.copy()
-        
-        if columns is None:
-            columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        
-        for column in columns:
-            if column in df.columns and pd.api.types.is_numeric_dtype(df[column]):
-                Q1 = df[column].quantile(0.25)
-                Q3 = df[column].quantile(0.75)
-                IQR = Q3 - Q1
-                
-                if IQR != 0:
-                    df_scaled[column] = (df[column] - df[column].median()) / IQR
-                    logger.info(f"Colonne '{column}' transformée avec RobustScaler")
-        
+        df_scaled = df.copy(deep=False)
+
+        # Partition des dtypes en une seule passe sur le block manager
+        columns = numeric_columns(df, columns)
+
+        if columns:
+            # Les trois quantiles de toutes les colonnes en un seul appel
+            # (introselect O(N)), au lieu de deux tris complets par colonne
+            X = df[columns].to_numpy(dtype=np.float64)
+            Q1, median, Q3 = np.nanquantile(X, [0.25, 0.5, 0.75], axis=0)
+            IQR = Q3 - Q1
+
+            nonzero = IQR != 0
+            scaled_columns = [col for col, keep in zip(columns, nonzero) if keep]
+            if scaled_columns:
+                scaled = (X[:, nonzero] - median[nonzero]) / IQR[nonzero]
+                df_scaled[scaled_columns] = scaled.astype(dtype, copy=False)
+                logger.info(f"{len(scaled_columns)} colonnes transformées avec RobustScaler ({dtype})")
+
         return df_scaled
\ No newline at end of file
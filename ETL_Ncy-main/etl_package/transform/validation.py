@@ -3,13 +3,70 @@ Module pour la validation des données.
 Vérification des types, cohérence des colonnes et qualité des données.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional
 import logging
 
+try:
+    import numexpr
+except ImportError:  # numexpr est optionnel, repli NumPy pur
+    numexpr = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow est optionnel, repli dtypes NumPy/category
+    pa = None
+
 logger = logging.getLogger(__name__)
 
+# Rapports de validation de schéma mémorisés: le verdict de
+# validate_data_types ne dépend que des colonnes, des dtypes et des types
+# attendus, donc la clé capture tout ce qui peut le changer. Les
+# vérifications qui lisent les valeurs (manquants, plages) ne sont pas
+# mises en cache: une mutation en place ne changerait pas la clé
+_validation_cache: Dict[tuple, Dict[str, Any]] = {}
+_VALIDATION_CACHE_MAX = 128
+
+
+def _validation_key(df: pd.DataFrame, check: str, params: tuple) -> tuple:
+    return (check, tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes), params)
+
+
+def _missing_details_frame(columns, null_counts, pct, above) -> pd.DataFrame:
+    """
+    Détails des manquants sous forme colonnaire: trois tableaux compacts
+    (Arrow si disponible, sinon NumPy étroit + category) au lieu d'un dict
+    Python de ~200 octets par colonne — plus petit et plus rapide à
+    sérialiser sur les schémas larges.
+    """
+    status = np.where(above, 'CRITIQUE', 'ACCEPTABLE')
+    if pa is not None:
+        return pd.DataFrame({
+            'missing_count': pd.array(null_counts.astype(np.int32),
+                                      dtype=pd.ArrowDtype(pa.int32())),
+            'missing_percent': pd.array(pct.astype(np.float32),
+                                        dtype=pd.ArrowDtype(pa.float32())),
+            'status': pd.arrays.ArrowExtensionArray(
+                pa.array(status.tolist()).dictionary_encode()),
+        }, index=columns)
+    return pd.DataFrame({
+        'missing_count': null_counts.astype(np.int32),
+        'missing_percent': pct.astype(np.float32),
+        'status': pd.Categorical(status),
+    }, index=columns)
+
+
+def _cache_report(key: tuple, report: Dict[str, Any]) -> Dict[str, Any]:
+    if len(_validation_cache) >= _VALIDATION_CACHE_MAX:
+        _validation_cache.pop(next(iter(_validation_cache)))
+    _validation_cache[key] = report
+    return report
+
+
 class DataValidator:
     """
     Classe pour la validation et la vérification de la qualité des données.
@@ -28,30 +85,49 @@ class DataValidator:
         Returns:
             dict: Résultats de la validation
         """
+        cache_key = _validation_key(df, 'data_types', tuple(sorted(
+            (column, str(expected)) for column, expected in expected_types.items()
+        )))
+        cached = _validation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         validation_results = {
             'valid': True,
             'errors': [],
             'details': {}
         }
-        
+
+        # Les dtypes réels sont capturés en un seul zip C; les colonnes
+        # manquantes sortent d'une différence d'ensembles et la comparaison
+        # se fait par hachage dict, sans is_dtype_equal par colonne
+        actual_types = dict(zip(df.columns, df.dtypes))
+        missing = expected_types.keys() - actual_types.keys()
+
         for column, expected_type in expected_types.items():
-            if column not in df.columns:
+            if column in missing:
                 validation_results['valid'] = False
                 validation_results['errors'].append(f"Colonne manquante: {column}")
                 validation_results['details'][column] = 'MANQUANTE'
+                continue
+            actual_type = actual_types[column]
+            try:
+                matches = actual_type == pd.api.types.pandas_dtype(expected_type)
+            except TypeError:
+                matches = False
+            if not matches:
+                validation_results['valid'] = False
+                validation_results['errors'].append(
+                    f"Type incorrect pour {column}: attendu {expected_type}, obtenu {actual_type}"
+                )
+                validation_results['details'][column] = f"INVALID: {actual_type}"
             else:
-                actual_type = df[column].dtype
-                if not pd.api.types.is_dtype_equal(actual_type, expected_type):
-                    validation_results['valid'] = False
-                    validation_results['errors'].append(
-                        f"Type incorrect pour {column}: attendu {expected_type}, obtenu {actual_type}"
-                    )
-                    validation_results['details'][column] = f"INVALID: {actual_type}"
-                else:
-                    validation_results['details'][column] = f"VALID: {actual_type}"
+                validation_results['details'][column] = f"VALID: {actual_type}"
         
-        logger.info(f"Validation des types: {validation_results['valid']}")
-        return validation_results
+        # Interpolation %s paresseuse: la chaîne n'est construite que si le
+        # niveau INFO est réellement émis
+        logger.info("Validation des types: %s", validation_results['valid'])
+        return _cache_report(cache_key, validation_results)
     
     @staticmethod
     def check_missing_values(df: pd.DataFrame, threshold: float = 0.8) -> Dict[str, Any]:
@@ -65,33 +141,36 @@ class DataValidator:
         Returns:
             dict: Rapport des valeurs manquantes
         """
-        missing_count = df.isnull().sum()
-        missing_percent = (missing_count / len(df)) * 100
-        
+        # Les dtypes NumPy int/uint/bool ne peuvent pas contenir de nul:
+        # leurs colonnes sont comptées à zéro sans balayage. Le masque de
+        # nullité n'est construit que pour les colonnes restantes, en une
+        # seule passe, puis tout est dérivé en vecteurs sans boucle Python
+        columns = df.columns.to_numpy()
+        null_free = np.array([isinstance(dtype, np.dtype) and dtype.kind in 'iub'
+                              for dtype in df.dtypes], dtype=bool)
+        null_counts = np.zeros(len(columns), dtype=np.int64)
+        if not null_free.all():
+            # any() court-circuite dès le premier nul rencontré; la somme
+            # complète n'est calculée que pour les colonnes qui en ont
+            mask = df.loc[:, ~null_free].isna().to_numpy()
+            has_null = mask.any(axis=0)
+            if has_null.any():
+                scan_idx = np.flatnonzero(~null_free)[has_null]
+                null_counts[scan_idx] = mask[:, has_null].sum(axis=0)
+        pct = null_counts * (100.0 / len(df)) if len(df) else np.zeros(len(columns))
+        above = pct > threshold * 100
+
         report = {
             'total_rows': len(df),
             'total_columns': len(df.columns),
             'missing_summary': {
-                'columns_above_threshold': [],
-                'columns_below_threshold': []
+                'columns_above_threshold': columns[above].tolist(),
+                'columns_below_threshold': columns[~above].tolist()
             },
-            'details': {}
+            'details': _missing_details_frame(df.columns, null_counts, pct, above)
         }
-        
-        for column in df.columns:
-            percent_missing = missing_percent[column]
-            report['details'][column] = {
-                'missing_count': missing_count[column],
-                'missing_percent': percent_missing,
-                'status': 'ACCEPTABLE' if percent_missing <= threshold * 100 else 'CRITIQUE'
-            }
-            
-            if percent_missing > threshold * 100:
-                report['missing_summary']['columns_above_threshold'].append(column)
-            else:
-                report['missing_summary']['columns_below_threshold'].append(column)
-        
-        logger.info(f"Vérification des valeurs manquantes terminée")
+
+        logger.info("Vérification des valeurs manquantes terminée")
         return report
     
     @staticmethod
@@ -112,37 +191,79 @@ class DataValidator:
             'errors': [],
             'out_of_range': {}
         }
-        
-        for column, (min_val, max_val) in value_ranges.items():
-            if column in df.columns and pd.api.types.is_numeric_dtype(df[column]):
-                out_of_range = df[(df[column] < min_val) | (df[column] > max_val)]
-                count_out_of_range = len(out_of_range)
-                
-                if count_out_of_range > 0:
-                    validation_results['valid'] = False
-                    validation_results['errors'].append(
-                        f"{count_out_of_range} valeurs hors plage pour {column} ({min_val}-{max_val})"
-                    )
-                    validation_results['out_of_range'][column] = {
-                        'count': count_out_of_range,
-                        'min_allowed': min_val,
-                        'max_allowed': max_val,
-                        'actual_min': df[column].min(),
-                        'actual_max': df[column].max()
-                    }
-        
-        logger.info(f"Validation des plages de valeurs: {validation_results['valid']}")
+
+        # Snapshot des dtypes une fois pour toutes; le caractère .kind
+        # suffit à tester la numéricité sans is_numeric_dtype par colonne
+        dtype_kinds = {column: dtype.kind for column, dtype in zip(df.columns, df.dtypes)}
+
+        def check_column(item):
+            # Comparaisons ufunc sur le ndarray sous-jacent: pas de Series
+            # intermédiaires ni de copie de lignes df[mask] — seul le compte
+            # est conservé
+            column, (min_val, max_val) = item
+            if dtype_kinds.get(column) not in ('i', 'u', 'f'):
+                return None
+            arr = df[column].to_numpy(copy=False)
+            if numexpr is not None and arr.dtype.kind in 'fiu':
+                # Expression fusionnée: comparaison, ou et somme en un seul
+                # passage par blocs, sans les deux tableaux booléens
+                # temporaires de la version NumPy
+                count_out_of_range = int(numexpr.evaluate(
+                    'sum((arr < lo) | (arr > hi))',
+                    local_dict={'arr': arr, 'lo': min_val, 'hi': max_val}
+                ))
+            else:
+                mask = (arr < min_val) | (arr > max_val)
+                count_out_of_range = int(np.count_nonzero(mask))
+            if count_out_of_range == 0:
+                return None
+            return column, {
+                'count': count_out_of_range,
+                'min_allowed': min_val,
+                'max_allowed': max_val,
+                'actual_min': np.nanmin(arr),
+                'actual_max': np.nanmax(arr)
+            }
+
+        items = list(value_ranges.items())
+        # Les comparaisons NumPy relâchent le GIL: un pool de threads scale
+        # avec le nombre de colonnes sur les frames larges. En dessous du
+        # seuil, le coût du pool dépasserait le gain
+        if len(items) >= 8 and len(df) >= 10_000:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                outcomes = list(executor.map(check_column, items))
+        else:
+            outcomes = [check_column(item) for item in items]
+
+        for outcome in outcomes:
+            if outcome is not None:
+                column, details = outcome
+                validation_results['valid'] = False
+                validation_results['errors'].append(
+                    f"{details['count']} valeurs hors plage pour {column} "
+                    f"({details['min_allowed']}-{details['max_allowed']})"
+                )
+                validation_results['out_of_range'][column] = details
+
+
+        logger.info("Validation des plages de valeurs: %s", validation_results['valid'])
         return validation_results
     
     @staticmethod
-    def check_duplicates(df: pd.DataFrame, subset: Optional[List[str]] = None) -> Dict[str, Any]:
+    def check_duplicates(df: pd.DataFrame, subset: Optional[List[str]] = None,
+                         max_samples: int = 100,
+                         include_rows: bool = True) -> Dict[str, Any]:
         """
         Vérifie les doublons dans le DataFrame.
-        
+
         Args:
             df (pd.DataFrame): DataFrame à vérifier
             subset (list): Sous-ensemble de colonnes pour la vérification
-            
+            max_samples (int): Nombre maximal de lignes dupliquées conservées
+                dans le rapport (le compte reste exact)
+            include_rows (bool): Matérialiser l'échantillon de lignes; False
+                pour les appelants qui ne lisent que le compte
+
         Returns:
             dict: Rapport des doublons
         """
@@ -151,19 +272,154 @@ class DataValidator:
             'duplicate_rows': pd.DataFrame(),
             'is_clean': True
         }
-        
-        if subset:
-            duplicates = df[df.duplicated(subset=subset, keep=False)]
+
+        # Seul le compte est exhaustif; le rapport n'embarque qu'un
+        # échantillon de lignes pour ne pas doubler la mémoire sur les
+        # grands frames
+        if subset and all(isinstance(df[column].dtype, np.dtype)
+                          and df[column].dtype.kind in 'iuf' for column in subset):
+            # Sous-ensemble entièrement numérique: les lignes sont vues
+            # comme des enregistrements structurés et dédoublonnées par
+            # np.unique, sans la factorisation pandas colonne par colonne
+            arr = np.ascontiguousarray(df[subset].to_numpy())
+            if arr.dtype.kind == 'f' and np.isnan(arr).any():
+                # np.unique sépare les NaN là où pandas les regroupe:
+                # repli sur duplicated pour garder la même sémantique
+                mask = df.duplicated(subset=subset, keep=False).to_numpy()
+            else:
+                keys = arr.view([('', arr.dtype)] * arr.shape[1]).ravel()
+                _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+                mask = counts[inverse] > 1
         else:
-            duplicates = df[df.duplicated(keep=False)]
-        
-        duplicate_report['total_duplicates'] = len(duplicates)
-        duplicate_report['duplicate_rows'] = duplicates
-        duplicate_report['is_clean'] = len(duplicates) == 0
-        
+            mask = df.duplicated(subset=subset, keep=False).to_numpy()
+        total = int(mask.sum())
+
+        duplicate_report['total_duplicates'] = total
+        if total > 0 and include_rows:
+            duplicate_report['duplicate_rows'] = df.iloc[np.flatnonzero(mask)[:max_samples]]
+        duplicate_report['is_clean'] = total == 0
+
         if duplicate_report['total_duplicates'] > 0:
-            logger.warning(f"{duplicate_report['total_duplicates']} doublons détectés")
+            logger.warning("%d doublons détectés", duplicate_report['total_duplicates'])
         else:
             logger.info("Aucun doublon détecté")
-        
-        return duplicate_report
\ No newline at end of file
+
+        return duplicate_report
+
+    @staticmethod
+    def run_all(df: pd.DataFrame,
+                expected_types: Optional[Dict[str, type]] = None,
+                value_ranges: Optional[Dict[str, tuple]] = None,
+                missing_threshold: float = 0.8,
+                duplicates_subset: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Exécute toutes les vérifications en une seule passe colonne par
+        colonne: type attendu, valeurs manquantes et plage de valeurs sont
+        évalués sur le même tableau pendant qu'il est chaud en cache, au
+        lieu d'un balayage complet du frame par vérification.
+
+        Args:
+            df (pd.DataFrame): DataFrame à valider
+            expected_types (dict): Types attendus {'colonne': type}
+            value_ranges (dict): Plages attendues {'colonne': (min, max)}
+            missing_threshold (float): Seuil d'acceptation des manquants
+            duplicates_subset (list): Sous-ensemble pour les doublons
+
+        Returns:
+            dict: Rapports par vérification + indicateur global 'valid'
+        """
+        expected_types = expected_types or {}
+        value_ranges = value_ranges or {}
+
+        types_report = {'valid': True, 'errors': [], 'details': {}}
+        missing_report = {
+            'total_rows': len(df),
+            'total_columns': len(df.columns),
+            'missing_summary': {
+                'columns_above_threshold': [],
+                'columns_below_threshold': []
+            },
+            'details': {}
+        }
+        ranges_report = {'valid': True, 'errors': [], 'out_of_range': {}}
+        null_counts = np.zeros(len(df.columns), dtype=np.int64)
+
+        for position, (column, series) in enumerate(df.items()):
+            dtype = series.dtype
+            numpy_backed = isinstance(dtype, np.dtype)
+            arr = series.to_numpy(copy=False) if numpy_backed else None
+
+            # Valeurs manquantes (fast path dtypes sans nul, cf.
+            # check_missing_values)
+            if numpy_backed and dtype.kind in 'iub':
+                null_count = 0
+            elif numpy_backed and dtype.kind == 'f':
+                null_count = int(np.isnan(arr).sum())
+            else:
+                null_count = int(series.isna().sum())
+            null_counts[position] = null_count
+
+            # Type attendu
+            expected = expected_types.get(column)
+            if expected is not None:
+                try:
+                    matches = dtype == pd.api.types.pandas_dtype(expected)
+                except TypeError:
+                    matches = False
+                if not matches:
+                    types_report['valid'] = False
+                    types_report['errors'].append(
+                        f"Type incorrect pour {column}: attendu {expected}, obtenu {dtype}"
+                    )
+                    types_report['details'][column] = f"INVALID: {dtype}"
+                else:
+                    types_report['details'][column] = f"VALID: {dtype}"
+
+            # Plage de valeurs
+            bounds = value_ranges.get(column)
+            if bounds is not None and pd.api.types.is_numeric_dtype(series):
+                min_val, max_val = bounds
+                if arr is None:
+                    arr = series.to_numpy()
+                mask = (arr < min_val) | (arr > max_val)
+                count = int(np.count_nonzero(mask))
+                if count > 0:
+                    ranges_report['valid'] = False
+                    ranges_report['errors'].append(
+                        f"{count} valeurs hors plage pour {column} ({min_val}-{max_val})"
+                    )
+                    ranges_report['out_of_range'][column] = {
+                        'count': count,
+                        'min_allowed': min_val,
+                        'max_allowed': max_val,
+                        'actual_min': np.nanmin(arr),
+                        'actual_max': np.nanmax(arr)
+                    }
+
+        for column in expected_types.keys() - set(df.columns):
+            types_report['valid'] = False
+            types_report['errors'].append(f"Colonne manquante: {column}")
+            types_report['details'][column] = 'MANQUANTE'
+
+        pct = null_counts * (100.0 / len(df)) if len(df) else np.zeros(len(df.columns))
+        above = pct > missing_threshold * 100
+        columns_arr = df.columns.to_numpy()
+        missing_report['missing_summary']['columns_above_threshold'] = columns_arr[above].tolist()
+        missing_report['missing_summary']['columns_below_threshold'] = columns_arr[~above].tolist()
+        missing_report['details'] = _missing_details_frame(df.columns, null_counts, pct, above)
+
+        duplicates_report = DataValidator.check_duplicates(
+            df, subset=duplicates_subset, include_rows=False
+        )
+
+        report = {
+            'data_types': types_report,
+            'missing_values': missing_report,
+            'value_ranges': ranges_report,
+            'duplicates': duplicates_report,
+            'valid': (types_report['valid'] and ranges_report['valid']
+                      and duplicates_report['is_clean']
+                      and not missing_report['missing_summary']['columns_above_threshold'])
+        }
+        logger.info("Validation globale: %s", report['valid'])
+        return report
\ No newline at end of file
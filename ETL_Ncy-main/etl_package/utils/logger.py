@@ -3,49 +3,76 @@ Module de configuration du logging pour l'ensemble du package.
 Fournit une configuration centralisée des logs.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from ..config.config import config
 
-def setup_logger(name: str = 'etl_package', log_level: str = None) -> logging.Logger:
+@functools.lru_cache(maxsize=1)
+def _start_listener() -> queue.Queue:
     """
-    Configure et retourne un logger avec une configuration standard.
-    
-    Args:
-        name (str): Nom du logger
-        log_level (str): Niveau de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        
-    Returns:
-        logging.Logger: Logger configuré
+    Démarre une fois le QueueListener d'arrière-plan qui porte les
+    handlers console et fichier. Les threads appelants ne paient qu'un
+    put dans la file; le formatage et les écritures se font sur le
+    thread du listener.
     """
-    log_level = log_level or config.LOG_LEVEL
-    
-    # Créer le logger
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Éviter les handlers multiples
-    if logger.handlers:
-        logger.handlers.clear()
-    
-    # Formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    
+
     # Handler console
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # Handler fichier
+
+    # Handler fichier: delay=True diffère l'ouverture du descripteur
+    # jusqu'au premier enregistrement émis
     log_file = Path('logs/etl_package.log')
     log_file.parent.mkdir(exist_ok=True)
-    
-    file_handler = logging.FileHandler(log_file)
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
-    return logger
\ No newline at end of file
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    return log_queue
+
+@functools.lru_cache(maxsize=None)
+def _configure_logger(name: str, log_level: str) -> logging.Logger:
+    """
+    Construit les handlers une seule fois par couple (name, log_level):
+    les appels répétés de setup_logger (tests, notebooks) ne recréent ni
+    formatter ni handlers et ne rouvrent pas de descripteur de fichier.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, log_level.upper()))
+
+    # Éviter les handlers multiples (logger déjà configuré hors cache)
+    if logger.handlers:
+        logger.handlers.clear()
+
+    # Seul un QueueHandler est attaché au logger: aucune E/S sur le
+    # thread émetteur
+    logger.addHandler(logging.handlers.QueueHandler(_start_listener()))
+
+    return logger
+
+def setup_logger(name: str = 'etl_package', log_level: str = None) -> logging.Logger:
+    """
+    Configure et retourne un logger avec une configuration standard.
+
+    Args:
+        name (str): Nom du logger
+        log_level (str): Niveau de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+
+    Returns:
+        logging.Logger: Logger configuré
+    """
+    return _configure_logger(name, log_level or config.LOG_LEVEL)
\ No newline at end of file
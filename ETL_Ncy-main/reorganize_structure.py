@@ -7,40 +7,55 @@ import os
 import shutil
 from pathlib import Path
 
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Écrit le fichier seulement si son contenu diffère: les relances ne
+    touchent pas le disque et n'invalident pas les caches des indexeurs.
+    La taille (stat) sert de pré-vérification avant de lire le contenu.
+    """
+    data = content.encode()
+    if path.exists():
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    path.write_text(content)
+    return True
+
 def reorganize_structure():
     print("🔧 Réorganisation de la structure...")
-    
+
     # Chemins importants
     base_dir = Path('etl_package')
     config_file = base_dir / 'config.py'
-    
+
     # 1. Créer les dossiers manquants
     folders = ['config', 'extract', 'transform', 'load', 'pipelines', 'utils']
     for folder in folders:
         (base_dir / folder).mkdir(exist_ok=True)
-        # Créer les __init__.py
+        # Créer les __init__.py manquants seulement: sinon chaque relance
+        # écraserait le contenu réel avec l'échafaudage avant de le réécrire
         init_file = base_dir / folder / '__init__.py'
-        init_file.write_text('# ' + folder + ' module\n')
-    
-    # 2. Déplacer config.py dans config/
-    if config_file.exists():
+        if not init_file.exists():
+            init_file.write_text('# ' + folder + ' module\n')
+
+    # 2. Déplacer config.py dans config/ (sauf s'il est déjà en place)
+    if config_file.exists() and not (base_dir / 'config' / 'config.py').exists():
         shutil.move(str(config_file), str(base_dir / 'config' / 'config.py'))
         print("✅ config.py déplacé dans etl_package/config/")
-    
+
     # 3. Créer les fichiers manquants dans chaque dossier
     # config/
     config_init = base_dir / 'config' / '__init__.py'
-    config_init.write_text('''
+    write_if_changed(config_init, '''
 """
 Module de configuration
 """
 from .config import config
 __all__ = ['config']
 ''')
-    
+
     # extract/
     extract_init = base_dir / 'extract' / '__init__.py'
-    extract_init.write_text('''
+    write_if_changed(extract_init, '''
 """
 Modules d'extraction
 """
@@ -48,10 +63,10 @@ from .web_scraper import scrape_cacao_ratings, WebScraper
 from .data_loader import DataLoader
 __all__ = ['scrape_cacao_ratings', 'WebScraper', 'DataLoader']
 ''')
-    
+
     # transform/
     transform_init = base_dir / 'transform' / '__init__.py'
-    transform_init.write_text('''
+    write_if_changed(transform_init, '''
 """
 Modules de transformation
 """
@@ -62,10 +77,10 @@ from .feature_engineering import FeatureEngineer
 from .scaling import DataScaler
 __all__ = ['MissingValuesHandler', 'DataEncoder', 'DataValidator', 'FeatureEngineer', 'DataScaler']
 ''')
-    
+
     # load/
     load_init = base_dir / 'load' / '__init__.py'
-    load_init.write_text('''
+    write_if_changed(load_init, '''
 """
 Modules de chargement
 """
@@ -73,39 +88,37 @@ from .to_postgres import PostgreSQLLoader
 from .data_writer import DataWriter
 __all__ = ['PostgreSQLLoader', 'DataWriter']
 ''')
-    
+
     # pipelines/
     pipelines_init = base_dir / 'pipelines' / '__init__.py'
-    pipelines_init.write_text('''
+    write_if_changed(pipelines_init, '''
 """
 Pipelines ETL
 """
 from .etl_pipeline import ETLPipeline, run_pipeline, main
 __all__ = ['ETLPipeline', 'run_pipeline', 'main']
 ''')
-    
+
     # utils/
     utils_init = base_dir / 'utils' / '__init__.py'
-    utils_init.write_text('''
+    write_if_changed(utils_init, '''
 """
 Utilitaires
 """
 from .logger import setup_logger
 __all__ = ['setup_logger']
 ''')
-    
+
     print("✅ Structure réorganisée avec succès!")
-    
-    # Afficher la nouvelle structure
+
+    # Afficher la nouvelle structure (rglob évite le comptage de niveaux
+    # par répertoire d'os.walk)
     print("\n📁 Nouvelle structure:")
-    for root, dirs, files in os.walk('etl_package'):
-        level = root.replace('etl_package', '').count(os.sep)
-        indent = '  ' * level
-        print(f"{indent}{os.path.basename(root)}/")
-        subindent = '  ' * (level + 1)
-        for file in files:
-            if file.endswith('.py'):
-                print(f"{subindent}{file}")
+    print("etl_package/")
+    for path in sorted(base_dir.rglob('*.py')):
+        relative = path.relative_to(base_dir)
+        indent = '  ' * len(relative.parts)
+        print(f"{indent}{path.name}")
 
 if __name__ == "__main__":
-    reorganize_structure()
\ No newline at end of file
+    reorganize_structure()
@@ -22,12 +22,14 @@ def test_database_connection():
         loader = PostgreSQLLoader()
         print("✅ Connexion PostgreSQL réussie!")
         
-        # Tester avec un DataFrame simple
+        # Tester avec un DataFrame simple. Les dtypes sont déclarés à la
+        # construction: pandas n'a aucune inférence de type à exécuter
+        import numpy as np
         import pandas as pd
         test_data = pd.DataFrame({
-            'id': [1, 2, 3],
-            'name': ['Test1', 'Test2', 'Test3'],
-            'value': [10.5, 20.3, 30.1]
+            'id': np.array([1, 2, 3], dtype=np.int32),
+            'name': pd.array(['Test1', 'Test2', 'Test3'], dtype='string'),
+            'value': np.array([10.5, 20.3, 30.1], dtype=np.float32)
         })
         
         success = loader.load_dataframe(test_data, 'test_table', if_exists='replace')
@@ -4,6 +4,8 @@ Test complet du pipeline ETL
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from etl_package.extract.web_scraper import scrape_cacao_ratings
 from etl_package.transform.missing_values import MissingValuesHandler
 from etl_package.load.to_postgres import PostgreSQLLoader
@@ -12,39 +14,63 @@ from etl_package.load.to_postgres import PostgreSQLLoader
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def test_pipeline_etape_par_etape():
-    """Test du pipeline étape par étape"""
-    print("=== TEST PIPELINE ÉTAPE PAR ÉTAPE ===")
-    
+def run_pipeline_chunked(verbose: bool = True, chunk_rows: int = 500):
+    """
+    Exécute le pipeline étape par étape.
+
+    Le frame extrait est découpé en tranches de lignes; chaque tranche est
+    imputée puis chargée en append par un pool de threads, ce qui recouvre
+    l'imputation et l'insertion DB et borne la mémoire à une tranche.
+    """
+    def report(message):
+        if verbose:
+            print(message)
+
+    report("=== TEST PIPELINE ÉTAPE PAR ÉTAPE ===")
+
     try:
         # 1. EXTRACTION
-        print("1. 📥 EXTRACTION...")
+        report("1. 📥 EXTRACTION...")
         df = scrape_cacao_ratings()
         if df is None or df.empty:
-            print("❌ Échec de l'extraction")
+            report("❌ Échec de l'extraction")
             return False
-        print(f"   ✅ {df.shape[0]} lignes extraites")
-        
-        # 2. TRANSFORMATION
-        print("2. 🔄 TRANSFORMATION...")
-        df = MissingValuesHandler.impute_missing_values(df)
-        print("   ✅ Données transformées")
-        
-        # 3. CHARGEMENT
-        print("3. 📤 CHARGEMENT...")
+        report(f"   ✅ {df.shape[0]} lignes extraites")
+
+        # 2 + 3. TRANSFORMATION ET CHARGEMENT par tranches
+        report("2. 🔄 TRANSFORMATION + 📤 CHARGEMENT par tranches...")
         loader = PostgreSQLLoader()
-        success = loader.load_dataframe(df, 'cacao_ratings_test')
-        
+
+        def process_chunk(start, if_exists):
+            chunk = df.iloc[start:start + chunk_rows]
+            chunk = MissingValuesHandler.impute_missing_values(chunk)
+            return loader.load_dataframe(chunk, 'cacao_ratings_test', if_exists=if_exists)
+
+        # Première tranche en replace (création de la table), les suivantes
+        # en append, en parallèle
+        success = process_chunk(0, 'replace')
+        starts = list(range(chunk_rows, len(df), chunk_rows))
+        if success and starts:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(
+                    lambda start: process_chunk(start, 'append'), starts
+                ))
+            success = all(results)
+
         if success:
-            print("🎉 Pipeline terminé avec succès!")
+            report("🎉 Pipeline terminé avec succès!")
             return True
         else:
-            print("❌ Échec du chargement")
+            report("❌ Échec du chargement")
             return False
-            
+
     except Exception as e:
-        print(f"💥 Erreur: {e}")
+        report(f"💥 Erreur: {e}")
         return False
 
+def test_pipeline_etape_par_etape():
+    """Test du pipeline étape par étape (sans paramètre pour pytest)."""
+    return run_pipeline_chunked()
+
 if __name__ == "__main__":
-    test_pipeline_etape_par_etape()
\ No newline at end of file
+    test_pipeline_etape_par_etape()